@@ -7,77 +7,151 @@ Black and Purple color scheme
 import curses
 import pygame
 import numpy as np
+import math
 import os
 import time
 import threading
 from pathlib import Path
 from pygame import mixer
+from mutagen.mp3 import MP3
 
 
 class MP3Player:
+    # Seconds between visualizer steps. The EMA and peak decay factors are
+    # applied once per step and were tuned for the original ~100ms frame
+    VIZ_INTERVAL = 1 / 10
+
+    # Per-bar falloff within each frequency band
+    _BASS_FALLOFF = (1.0 - np.arange(16) / 25).astype(np.float32)
+    _MIDLOW_FALLOFF = (1.0 - np.arange(12) / 20).astype(np.float32)
+    _TREBLE_FALLOFF = (0.9 - np.arange(11) / 18).astype(np.float32)
+
+    # Per-bar variation range (random * scale + offset) for each band:
+    # bass 0-15, low-mids 16-27, mids 28-40, high-mids 41-52, treble 53-63
+    _VAR_SCALE = np.repeat(np.float32([0.6, 0.7, 0.8, 0.9, 1.0]), [16, 12, 13, 12, 11])
+    _VAR_OFFSET = np.repeat(np.float32([0.7, 0.6, 0.5, 0.4, 0.3]), [16, 12, 13, 12, 11])
+
+    # Band gain folded into the falloff so a frame is one multiply per table
+    _BAND_SHAPE = np.concatenate([
+        1.6 * _BASS_FALLOFF,     # Increased from 0.9 to 1.6
+        1.35 * _MIDLOW_FALLOFF,  # Increased from 0.75
+        np.full(13, 1.2),        # Increased from 0.65
+        np.full(12, 1.0),        # Increased from 0.55
+        0.85 * _TREBLE_FALLOFF,  # Increased from 0.45
+    ]).astype(np.float32)
+
     def __init__(self, songs_dir="songs"):
         self.songs_dir = songs_dir
         self.songs = []
+        self.song_paths = []
         self.current_song_index = 0
         self.paused = False
         self.volume = 0.7
         self.running = True
-        self.audio_data = np.zeros(64)
+        # Visualizer state is float32: bars are quantized to rows anyway
+        self.audio_data = np.zeros(64, dtype=np.float32)
         self.song_start_time = 0
         self.pause_time = 0
         self.seek_offset = 0  # Track manual seeking offset
-        self.peak_data = np.zeros(64)  # Track peak values for bars
+        self.peak_data = np.zeros(64, dtype=np.float32)  # Track peak values for bars
+        self._frame = np.empty(64, dtype=np.float32)  # Scratch for new frame data
         self.beat_intensity = 0  # Simulated beat intensity
+        self._beat_phase = 0.0  # Phase of the simulated beat, in radians
+        self._rng = np.random.default_rng()
         self.current_song_length = 0  # Cached song length
+        self.song_lengths = []  # Lengths read from MP3 headers, per song
+        self.busy = False  # Mixer busy state, polled once per frame
+
+        # Serializes every mixer.music call so state transitions are atomic.
+        # Re-entrant because seeking can fall back to calling play_song.
+        self._mixer_lock = threading.RLock()
+        self._loaded_path = None  # File currently loaded into mixer.music
+
+        # Color attributes, filled in by main() once curses colors exist
+        self.CP1 = self.CP2 = self.CP3 = self.CP4 = self.CP5 = self.CP3B = 0
+
+        # What the visualizer last drew, so unchanged bars can be skipped
+        self.prev_bar_heights = np.zeros(64, dtype=np.int16)
+        self.prev_peak_heights = np.zeros(64, dtype=np.int16)
+        self.glitch_cells = []  # Screen cells covered by the last glitch
+        self._static_pad = None  # Pre-rendered controls and art, per screen size
 
         # Initialize pygame mixer
+        # A larger buffer rides out the 50ms UI frame without audio glitches
         pygame.init()
-        mixer.init(frequency=44100, size=-16, channels=2, buffer=512)
+        mixer.init(frequency=44100, size=-16, channels=2, buffer=2048)
 
         # Load songs
         self.load_songs()
 
+        # Visualizer state is stepped on its own thread at a fixed rate,
+        # independent of how long the terminal takes to draw a frame
+        self._viz_lock = threading.Lock()
+        threading.Thread(target=self._viz_loop, daemon=True).start()
+
     def load_songs(self):
         """Load all MP3 files from the songs directory"""
         songs_path = Path(self.songs_dir)
         if not songs_path.exists():
             songs_path.mkdir(parents=True)
 
-        self.songs = sorted([f for f in os.listdir(self.songs_dir)
-                            if f.lower().endswith('.mp3')])
+        # scandir gets the file type from the directory listing, no stat needed
+        with os.scandir(self.songs_dir) as entries:
+            found = sorted((entry.name, entry.path) for entry in entries
+                           if entry.is_file()
+                           and entry.name.lower().endswith('.mp3'))
+
+        self.songs = [name for name, _ in found]
+        self.song_paths = [path for _, path in found]  # Full paths, joined once
+
+        # Read every song length once, up front, from the MP3 headers
+        self.song_lengths = [self.read_song_length(path) for _, path in found]
+
+    def read_song_length(self, song_path):
+        """Read song length from the MP3 header without decoding the audio"""
+        try:
+            return MP3(song_path).info.length
+        except Exception:
+            return 0
 
     def play_song(self, start_pos=0):
         """Play the current song from a specific position"""
         if not self.songs:
             return
 
-        song_path = os.path.join(self.songs_dir, self.songs[self.current_song_index])
+        song_path = self.song_paths[self.current_song_index]
         try:
-            mixer.music.load(song_path)
-            mixer.music.set_volume(self.volume)
-            mixer.music.play(start=start_pos)
+            with self._mixer_lock:
+                # Only hand the file to the decoder when the song changes
+                if song_path != self._loaded_path:
+                    mixer.music.load(song_path)
+                    self._loaded_path = song_path
+                mixer.music.set_volume(self.volume)
+                mixer.music.play(start=start_pos)
+            self.busy = True
             self.paused = False
             self.song_start_time = time.time()
             self.seek_offset = start_pos
 
-            # Cache the song length (only calculate once per song)
-            try:
-                sound = pygame.mixer.Sound(song_path)
-                self.current_song_length = sound.get_length()
-            except:
-                self.current_song_length = 0
+            # Song length was read from the header when the songs were loaded
+            self.current_song_length = self.song_lengths[self.current_song_index]
         except Exception as e:
             pass
 
     def toggle_pause(self):
         """Toggle pause/play"""
         if self.paused:
-            mixer.music.unpause()
+            with self._mixer_lock:
+                mixer.music.unpause()
             # Adjust start time to account for pause duration
             self.song_start_time += (time.time() - self.pause_time)
             self.paused = False
+            # get_busy() reads False while paused; don't let the stale cached
+            # value trip the end-of-song check before the next poll
+            self.busy = True
         else:
-            mixer.music.pause()
+            with self._mixer_lock:
+                mixer.music.pause()
             self.pause_time = time.time()
             self.paused = True
 
@@ -95,7 +169,7 @@ class MP3Player:
 
     def seek_forward(self):
         """Seek forward 10 seconds"""
-        if not self.songs or not mixer.music.get_busy():
+        if not self.songs or not self.busy:
             return
 
         try:
@@ -103,15 +177,13 @@ class MP3Player:
             current_pos = self.get_song_position()
             new_pos = current_pos + 10
 
-            # Restart song from new position
-            mixer.music.stop()
-            self.play_song(start_pos=new_pos)
+            self.seek_to(new_pos)
         except:
             pass
 
     def seek_backward(self):
         """Seek backward 10 seconds"""
-        if not self.songs or not mixer.music.get_busy():
+        if not self.songs or not self.busy:
             return
 
         try:
@@ -119,25 +191,55 @@ class MP3Player:
             current_pos = self.get_song_position()
             new_pos = max(0, current_pos - 10)
 
-            # Restart song from new position
-            mixer.music.stop()
-            self.play_song(start_pos=new_pos)
+            self.seek_to(new_pos)
         except:
             pass
 
+    def seek_to(self, new_pos):
+        """Jump within the loaded song without reloading the file"""
+        with self._mixer_lock:
+            try:
+                mixer.music.set_pos(new_pos)
+            except pygame.error:
+                # Format can't seek in place - restart from the new position
+                self.play_song(start_pos=new_pos)
+                return
+        self.seek_offset = new_pos
+        self.song_start_time = time.time()
+
     def volume_up(self):
         """Increase volume"""
         self.volume = min(1.0, self.volume + 0.1)
-        mixer.music.set_volume(self.volume)
+        with self._mixer_lock:
+            mixer.music.set_volume(self.volume)
 
     def volume_down(self):
         """Decrease volume"""
         self.volume = max(0.0, self.volume - 0.1)
-        mixer.music.set_volume(self.volume)
+        with self._mixer_lock:
+            mixer.music.set_volume(self.volume)
+
+    def advance_if_finished(self):
+        """Move on to the next song once the current one has ended"""
+        with self._mixer_lock:
+            if not self.busy and not self.paused and self.songs:
+                self.next_song()
+
+    def stop(self):
+        """Stop playback"""
+        with self._mixer_lock:
+            mixer.music.stop()
+        self.busy = False
 
-    def get_song_position(self):
-        """Get current song position in seconds"""
-        if not mixer.music.get_busy():
+    def poll_mixer(self):
+        """Refresh the cached mixer busy state (call once per frame)"""
+        with self._mixer_lock:
+            self.busy = mixer.music.get_busy()
+        return self.busy
+
+    def get_song_position(self, now=None):
+        """Get current song position in seconds (optionally as of `now`)"""
+        if not self.busy:
             return 0
 
         if self.paused:
@@ -145,7 +247,9 @@ class MP3Player:
             elapsed = self.pause_time - self.song_start_time
         else:
             # Calculate elapsed time since song started
-            elapsed = time.time() - self.song_start_time
+            if now is None:
+                now = time.time()
+            elapsed = now - self.song_start_time
 
         return self.seek_offset + elapsed
 
@@ -155,74 +259,48 @@ class MP3Player:
 
     def generate_visualizer_data(self):
         """Generate classic car-style spectrum analyzer data - stationary bars"""
-        if mixer.music.get_busy() and not self.paused:
-            current_time = time.time()
-
+        if self.busy and not self.paused:
             # Simulate beat pattern for overall intensity - MORE INTENSE
             beat_freq = 1.8  # Consistent beat frequency
-            beat = (np.sin(current_time * beat_freq * 2 * np.pi) + 1) / 2
+            self._beat_phase = (self._beat_phase
+                                + self.VIZ_INTERVAL * beat_freq * 2 * math.pi) % (2 * math.pi)
+            beat = (math.sin(self._beat_phase) + 1) / 2
 
             # Create beat intensity variations with HIGHER peaks
             self.beat_intensity = self.beat_intensity * 0.75 + beat * 0.25
-            if np.random.random() < 0.015:  # Occasional drops
+            if self._rng.random() < 0.015:  # Occasional drops
                 self.beat_intensity *= 0.3
 
-            # Generate new frame of data with MUCH HIGHER amplitude
-            new_data = np.zeros(64)
+            # Generate new frame of data with MUCH HIGHER amplitude.
+            # Every step below works in place on one random draw, so the
+            # frame update allocates no temporaries.
+            new_data = self._rng.random(dtype=np.float32, out=self._frame)
+            new_data *= self._VAR_SCALE
+            new_data += self._VAR_OFFSET
+            new_data *= self._BAND_SHAPE
 
             # Bass frequencies (bars 0-15) - VERY HIGH and punchy
-            bass_base = (self.beat_intensity ** 1.3) * 1.6  # Increased from 0.9 to 1.6
-            for i in range(16):
-                # Each bar has independent movement with MORE variation
-                variation = np.random.random() * 0.6 + 0.7  # Higher range
-                strength = bass_base * variation * (1.0 - i / 25)
-                new_data[i] = strength
-
-            # Low-mids (bars 16-27) - Higher and more rhythmic
-            mid_low_base = self.beat_intensity * 1.35  # Increased from 0.75
-            for i in range(16, 28):
-                variation = np.random.random() * 0.7 + 0.6
-                strength = mid_low_base * variation * (1.0 - (i - 16) / 20)
-                new_data[i] = strength
-
-            # Mid frequencies (bars 28-40) - HIGHER peaks
-            mid_base = self.beat_intensity * 1.2  # Increased from 0.65
-            for i in range(28, 41):
-                variation = np.random.random() * 0.8 + 0.5
-                strength = mid_base * variation
-                new_data[i] = strength
-
-            # High-mids (bars 41-52) - More active and TALLER
-            high_mid_base = self.beat_intensity * 1.0  # Increased from 0.55
-            for i in range(41, 53):
-                variation = np.random.random() * 0.9 + 0.4
-                strength = high_mid_base * variation
-                new_data[i] = strength
-
-            # Treble frequencies (bars 53-63) - Sparkly and HIGHER
-            treble_base = self.beat_intensity * 0.85  # Increased from 0.45
-            for i in range(53, 64):
-                variation = np.random.random() * 1.0 + 0.3
-                strength = treble_base * variation * (0.9 - (i - 53) / 18)
-                new_data[i] = strength
+            new_data[:16] *= self.beat_intensity ** 1.3
+            # Everything above the bass follows the beat linearly
+            new_data[16:] *= self.beat_intensity
 
             # Add MORE frequent energy spikes with HIGHER amplitude
-            if np.random.random() < 0.12:  # More frequent
-                spike_bar = int(np.random.random() * 64)
+            if self._rng.random() < 0.12:  # More frequent
+                spike_bar = self._rng.integers(64)
                 new_data[spike_bar] = min(2.2, new_data[spike_bar] + 0.7)  # Much higher spikes
 
             # Allow MUCH HIGHER values for dramatic peaks
-            new_data = np.clip(new_data, 0, 2.2)  # Increased from 1.3 to 2.2
+            np.clip(new_data, 0, 2.2, out=new_data)  # Increased from 1.3 to 2.2
 
             # VERY fast response for snappy, reactive movement
-            self.audio_data = self.audio_data * 0.35 + new_data * 0.65  # More responsive
+            new_data *= 0.65  # More responsive
+            self.audio_data *= 0.35
+            self.audio_data += new_data
 
             # Update peaks - they fall more slowly
-            for i in range(len(self.audio_data)):
-                if self.audio_data[i] > self.peak_data[i]:
-                    self.peak_data[i] = self.audio_data[i]
-                else:
-                    self.peak_data[i] *= 0.94  # Slightly slower fall for peak hold
+            # Decay, then let the bar push the peak back up - two in-place ufuncs
+            np.multiply(self.peak_data, 0.94, out=self.peak_data)  # Slightly slower fall for peak hold
+            np.maximum(self.peak_data, self.audio_data, out=self.peak_data)
         else:
             # Fade out when paused
             self.audio_data *= 0.82
@@ -231,11 +309,27 @@ class MP3Player:
 
         return self.audio_data
 
+    def _viz_loop(self):
+        """Step the visualizer at a fixed rate until the player stops"""
+        while self.running:
+            with self._viz_lock:
+                self.generate_visualizer_data()
+            time.sleep(self.VIZ_INTERVAL)
+
+    def snapshot_visualizer(self):
+        """Return copies of the current bar and peak data"""
+        with self._viz_lock:
+            return self.audio_data.copy(), self.peak_data.copy()
+
 
 def draw_visualizer(stdscr, player, start_row, height, width):
     """Draw the enhanced audio visualizer with peaks"""
-    data = player.generate_visualizer_data()
-    peaks = player.peak_data
+    data, peaks = player.snapshot_visualizer()
+
+    # Bind per-cell lookups to locals once per frame
+    cp1, cp2, cp3, cp3b = player.CP1, player.CP2, player.CP3, player.CP3B
+    addstr = stdscr.addstr
+    lines, cols = curses.LINES, curses.COLS
 
     # Calculate bar width to fill the screen
     bar_count = len(data)  # Use all 64 data points
@@ -256,58 +350,89 @@ def draw_visualizer(stdscr, player, start_row, height, width):
         peak_height = int(peaks[i] * (height - 2))
         peak_height = min(peak_height, height - 2)
 
-        # Draw bar from bottom up with gradient
-        for j in range(bar_height):
+        # Only show the peak while it floats clear of the bar
+        if peak_height <= bar_height + 2:
+            peak_height = 0
+
+        # Skip bars that look the same as last frame
+        prev_bar_height = player.prev_bar_heights[i]
+        prev_peak_height = player.prev_peak_heights[i]
+        if bar_height == prev_bar_height and peak_height == prev_peak_height:
+            continue
+        player.prev_bar_heights[i] = bar_height
+        player.prev_peak_heights[i] = peak_height
+
+        # Clip the bar to the visualizer area once, then draw each row as
+        # one string. Narrow terminals would otherwise paint bars over the
+        # controls panel, which is no longer redrawn every frame.
+        draw_width = min(current_bar_width, min(width, cols) - col_start)
+        if draw_width <= 0:
+            continue
+
+        # Blank whatever the previous bar and peak drew above the new bar
+        blank = " " * draw_width
+        for j in range(bar_height, max(prev_bar_height, prev_peak_height + 1)):
             row = start_row + height - 2 - j
-
-            # Create gradient effect based on height percentage
-            height_percent = j / max(1, bar_height)
-
-            # Use different characters and colors for Lain theme
-            if height_percent > 0.85:
-                # Top of bar - bright cyan
-                char = "█"
-                color = curses.color_pair(3) | curses.A_BOLD
-            elif height_percent > 0.6:
-                # Upper middle - bright green/cyan
-                char = "█"
-                color = curses.color_pair(3)
-            elif height_percent > 0.3:
-                # Middle - medium green
-                char = "▓"
-                color = curses.color_pair(2)
-            else:
-                # Bottom - dark green
-                char = "▒"
-                color = curses.color_pair(1)
-
-            # Fill the full bar width
-            for w in range(current_bar_width):
-                col = col_start + w
-                if 0 <= row < curses.LINES and 0 <= col < curses.COLS:
-                    try:
-                        stdscr.addstr(row, col, char, color)
-                    except:
-                        pass
+            if 0 <= row < lines:
+                addstr(row, col_start, blank)
+
+        # Draw bar from bottom up with gradient: split the bar once into
+        # its four height bands, then fill each band as a straight run
+        idx30 = min(bar_height, int(0.3 * bar_height) + 1)
+        idx60 = min(bar_height, int(0.6 * bar_height) + 1)
+        idx85 = min(bar_height, int(0.85 * bar_height) + 1)
+        spans = (
+            (0, idx30, "▒", cp1),            # Bottom - dark green
+            (idx30, idx60, "▓", cp2),        # Middle - medium green
+            (idx60, idx85, "█", cp3),        # Upper middle - bright green/cyan
+            (idx85, bar_height, "█", cp3b),  # Top of bar - bright cyan
+        )
+        for span_start, span_end, char, color in spans:
+            segment = char * draw_width
+            for j in range(span_start, span_end):
+                row = start_row + height - 2 - j
+
+                # Fill the full bar width
+                if 0 <= row < lines:
+                    addstr(row, col_start, segment, color)
 
         # Draw peak indicator (falling dot)
-        if peak_height > bar_height + 2:
+        if peak_height:
             peak_row = start_row + height - 2 - peak_height
 
             # Fill the full bar width with peak indicator
-            for w in range(current_bar_width):
-                peak_col = col_start + w
-                if 0 <= peak_row < curses.LINES and 0 <= peak_col < curses.COLS:
-                    try:
-                        stdscr.addstr(peak_row, peak_col, "▬",
-                                    curses.color_pair(3) | curses.A_BOLD)
-                    except:
-                        pass
+            if 0 <= peak_row < lines:
+                addstr(peak_row, col_start, "▬" * draw_width, cp3b)
+
+
+def safe_addstr(win, row, col, text, attr=0, max_rows=None, max_cols=None):
+    """Write text clipped to the window so addstr never runs off the edge"""
+    if max_rows is None or max_cols is None:
+        max_rows, max_cols = win.getmaxyx()
+    if not (0 <= row < max_rows and 0 <= col < max_cols):
+        return
+
+    # curses can't write the bottom-right cell without erroring
+    room = max_cols - col - (1 if row == max_rows - 1 else 0)
+    if room > 0:
+        win.addstr(row, col, text[:room], attr)
+
+
+def clear_line(win, row, max_rows):
+    """Blank a whole screen row"""
+    if 0 <= row < max_rows:
+        win.move(row, 0)
+        win.clrtoeol()
 
 
-def draw_progress_bar(stdscr, player, row, width):
+# Prebuilt progress bar runs, sliced to length every frame
+PROGRESS_FILLED = "█" * 512
+PROGRESS_EMPTY = "░" * 512
+
+
+def draw_progress_bar(stdscr, player, row, width, height, now):
     """Draw the progress bar with Lain theme"""
-    position = player.get_song_position()
+    position = player.get_song_position(now)
     length = player.get_song_length()
 
     if length > 0:
@@ -315,19 +440,18 @@ def draw_progress_bar(stdscr, player, row, width):
     else:
         progress = 0
 
-    bar_width = width - 24
+    bar_width = max(0, width - 24)
     filled = int(progress * bar_width)
 
     # Time display
     time_str = f"{int(position//60):02d}:{int(position%60):02d} / {int(length//60):02d}:{int(length%60):02d}"
 
-    try:
-        stdscr.addstr(row, 2, "STREAM: ", curses.color_pair(2))
-        stdscr.addstr(row, 11, "█" * filled, curses.color_pair(3))
-        stdscr.addstr(row, 11 + filled, "░" * (bar_width - filled), curses.color_pair(5))
-        stdscr.addstr(row, width - len(time_str) - 2, time_str, curses.color_pair(2))
-    except:
-        pass
+    safe_addstr(stdscr, row, 2, "STREAM: ", player.CP2, height, width)
+    safe_addstr(stdscr, row, 11, PROGRESS_FILLED[:filled], player.CP3, height, width)
+    safe_addstr(stdscr, row, 11 + filled, PROGRESS_EMPTY[:bar_width - filled],
+                player.CP5, height, width)
+    safe_addstr(stdscr, row, width - len(time_str) - 2, time_str, player.CP2,
+                height, width)
 
 
 def draw_lain_art(stdscr, height, width):
@@ -361,45 +485,58 @@ def draw_lain_art(stdscr, height, width):
         "OPEN THE nExt",
     ]
 
-    try:
-        # Draw Lain face ASCII art (bottom right)
-        if height > 20 and width > 75:
-            start_row = height - 15
-            start_col = width - 22
-            for i, line in enumerate(lain_face):
-                if start_row + i < height - 5:
-                    stdscr.addstr(start_row + i, start_col, line, curses.color_pair(3))
-
-        # Draw Wired connection box (right side, middle)
-        if height > 20 and width > 70:
-            start_row = height // 2
-            start_col = width - 25
-            for i, line in enumerate(wired_art):
-                if start_row + i < height - 5:
-                    stdscr.addstr(start_row + i, start_col, line, curses.color_pair(3))
-
-        # Draw quotes (bottom left)
-        if height > 10 and width > 40:
-            quote_row = height - 3
-            for i, quote in enumerate(quotes):
-                if quote_row - i >= height - 4:
-                    stdscr.addstr(height - 3 + i, 2, f"// {quote}", curses.color_pair(5))
-
-        # Add some digital noise/glitch effect
-        import random
-        if random.random() < 0.1 and height > 15 and width > 80:
-            glitch_chars = ["█", "▓", "▒", "░", "▪", "▫"]
-            for _ in range(3):
-                x = random.randint(width - 26, width - 3)
-                y = random.randint(6, min(height - 6, height // 2 - 2))
-                char = random.choice(glitch_chars)
-                stdscr.addstr(y, x, char, curses.color_pair(4))
-
-    except:
-        pass
-
-
-def draw_controls(stdscr, start_row, start_col):
+    # Draw Lain face ASCII art (bottom right)
+    if height > 20 and width > 75:
+        start_row = height - 15
+        start_col = width - 22
+        for i, line in enumerate(lain_face):
+            if start_row + i < height - 5:
+                safe_addstr(stdscr, start_row + i, start_col, line, curses.color_pair(3),
+                            height, width)
+
+    # Draw Wired connection box (right side, middle)
+    if height > 20 and width > 70:
+        start_row = height // 2
+        start_col = width - 25
+        for i, line in enumerate(wired_art):
+            if start_row + i < height - 5:
+                safe_addstr(stdscr, start_row + i, start_col, line, curses.color_pair(3),
+                            height, width)
+
+    # Draw quotes (bottom left)
+    if height > 10 and width > 40:
+        quote_row = height - 3
+        for i, quote in enumerate(quotes):
+            if quote_row - i >= height - 4:
+                safe_addstr(stdscr, height - 3 + i, 2, f"// {quote}", curses.color_pair(5),
+                            height, width)
+
+
+# Characters used for digital noise/glitch effects
+GLITCH_CHARS = np.array(["█", "▓", "▒", "░", "▪", "▫"], dtype=object)
+INTRO_GLITCH_CHARS = np.array(["█", "▓", "▒", "░", "▪", "▫", "#", "@"], dtype=object)
+
+
+def draw_glitch(stdscr, player, height, width):
+    """Add some digital noise/glitch effect over the right-side panel"""
+    # Wipe last frame's glitch by copying the pre-rendered cells back
+    for y, x in player.glitch_cells:
+        if 0 <= y < height and 0 <= x < width:
+            player._static_pad.overwrite(stdscr, y, x, y, x, y, x)
+    player.glitch_cells = []
+
+    rng = player._rng
+    if rng.random() < 0.1 and height > 15 and width > 80:
+        # Draw every glitch position and character in one go
+        xs = rng.integers(width - 26, width - 2, size=3).tolist()
+        ys = rng.integers(6, min(height - 6, height // 2 - 2) + 1, size=3).tolist()
+        chars = rng.choice(GLITCH_CHARS, size=3)
+        for y, x, char in zip(ys, xs, chars):
+            safe_addstr(stdscr, y, x, char, player.CP4, height, width)
+            player.glitch_cells.append((y, x))
+
+
+def draw_controls(stdscr, start_row, start_col, height, width):
     """Draw control instructions with Lain theme"""
     controls = [
         ("PROTOCOL", ""),
@@ -415,36 +552,68 @@ def draw_controls(stdscr, start_row, start_col):
         ("q", "DISCONNECT"),
     ]
 
-    try:
-        for i, (key, desc) in enumerate(controls):
-            row = start_row + i
-            if i == 0:
-                stdscr.addstr(row, start_col, f"[ {key} ]", curses.color_pair(3) | curses.A_BOLD)
-            elif i == 1:
-                stdscr.addstr(row, start_col, key, curses.color_pair(3))
-            else:
-                stdscr.addstr(row, start_col, f"[{key:^6}]", curses.color_pair(2))
-                stdscr.addstr(row, start_col + 9, desc, curses.color_pair(1))
-    except:
-        pass
+    for i, (key, desc) in enumerate(controls):
+        row = start_row + i
+        if i == 0:
+            safe_addstr(stdscr, row, start_col, f"[ {key} ]",
+                        curses.color_pair(3) | curses.A_BOLD, height, width)
+        elif i == 1:
+            safe_addstr(stdscr, row, start_col, key, curses.color_pair(3), height, width)
+        else:
+            safe_addstr(stdscr, row, start_col, f"[{key:^6}]", curses.color_pair(2),
+                        height, width)
+            safe_addstr(stdscr, row, start_col + 9, desc, curses.color_pair(1),
+                        height, width)
 
 
-def draw_ui(stdscr, player):
-    """Main UI drawing function"""
-    stdscr.erase()  # Use erase instead of clear to reduce flickering
+def build_static_pad(height, width):
+    """Render the controls, Lain art and quotes into an off-screen pad"""
+    pad = curses.newpad(height, width)
+    draw_controls(pad, 6, width - 26, height, width)
+    draw_lain_art(pad, height, width)
+    return pad
+
+
+def draw_static(stdscr, player):
+    """Draw the parts of the UI that only change on resize"""
+    stdscr.erase()
     height, width = stdscr.getmaxyx()
 
     # Lain-themed title
     title = "[ PRESENT DAY - PRESENT TIME ]"
     subtitle = ">> THE WIRED AUDIO INTERFACE <<"
-    try:
-        stdscr.addstr(0, (width - len(title)) // 2, title,
-                     curses.color_pair(3) | curses.A_BOLD)
-        if width > len(subtitle) + 4:
-            stdscr.addstr(1, (width - len(subtitle)) // 2, subtitle,
-                         curses.color_pair(2))
-    except:
-        pass
+    safe_addstr(stdscr, 0, (width - len(title)) // 2, title,
+                curses.color_pair(3) | curses.A_BOLD, height, width)
+    if width > len(subtitle) + 4:
+        safe_addstr(stdscr, 1, (width - len(subtitle)) // 2, subtitle,
+                    curses.color_pair(2), height, width)
+
+    # Controls and Lain art are rendered once per screen size into a pad,
+    # then copied onto the screen; glitches are wiped from the same pad
+    player._static_pad = build_static_pad(height, width)
+    player._static_pad.overlay(stdscr, 0, 0, 0, 0, height - 1, width - 1)
+
+    # Border decorations with Lain theme
+    for row in (5, height - 5):
+        if 0 <= row < height and width > 2:
+            stdscr.hline(row, 1, curses.ACS_HLINE | curses.color_pair(3), width - 2)
+
+    # Corner accents
+    safe_addstr(stdscr, 5, 0, "┌", curses.color_pair(3), height, width)
+    safe_addstr(stdscr, 5, width - 1, "┐", curses.color_pair(3), height, width)
+    safe_addstr(stdscr, height - 5, 0, "└", curses.color_pair(3), height, width)
+    safe_addstr(stdscr, height - 5, width - 1, "┘", curses.color_pair(3), height, width)
+
+    # The screen was just erased, so no bars or glitches are left on it
+    player.prev_bar_heights[:] = 0
+    player.prev_peak_heights[:] = 0
+    player.glitch_cells = []
+
+
+def draw_ui(stdscr, player):
+    """Main UI drawing function - redraws only what changes between frames"""
+    height, width = stdscr.getmaxyx()
+    now = time.time()  # One timestamp shared by the whole frame
 
     # Current song info with Lain styling
     if player.songs:
@@ -455,24 +624,18 @@ def draw_ui(stdscr, player):
         # Truncate if too long
         if len(song_info) > width - 4:
             song_info = song_info[:width-7] + "..."
-
-        try:
-            stdscr.addstr(3, 2, song_info, curses.color_pair(2))
-        except:
-            pass
     else:
-        try:
-            stdscr.addstr(3, 2, ">> NO DATA STREAM DETECTED - ADD FILES TO 'songs/' <<",
-                         curses.color_pair(4))
-        except:
-            pass
+        song_info = ">> NO DATA STREAM DETECTED - ADD FILES TO 'songs/' <<"
+
+    clear_line(stdscr, 3, height)
+    safe_addstr(stdscr, 3, 2, song_info,
+                player.CP2 if player.songs else player.CP4,
+                height, width)
 
     # Volume indicator
     volume_str = f"SIGNAL: {'█' * int(player.volume * 10)}{'░' * (10 - int(player.volume * 10))} {int(player.volume * 100)}%"
-    try:
-        stdscr.addstr(4, 2, volume_str, curses.color_pair(1))
-    except:
-        pass
+    clear_line(stdscr, 4, height)
+    safe_addstr(stdscr, 4, 2, volume_str, player.CP1, height, width)
 
     # Visualizer (reserve space for controls on the right)
     visualizer_height = height - 12
@@ -481,28 +644,18 @@ def draw_ui(stdscr, player):
         draw_visualizer(stdscr, player, 6, visualizer_height, visualizer_width)
 
     # Progress bar
-    draw_progress_bar(stdscr, player, height - 4, width)
+    progress_row = height - 4
+    clear_line(stdscr, progress_row, height)
+    draw_progress_bar(stdscr, player, progress_row, width, height, now)
 
-    # Controls (right side)
-    draw_controls(stdscr, 6, width - 26)
+    # On short terminals the controls panel reaches down to the progress
+    # row; put its cells back on top, as they were drawn after the bar
+    if 0 <= progress_row < height:
+        player._static_pad.overlay(stdscr, progress_row, 0, progress_row, 0,
+                                   progress_row, width - 1)
 
-    # Lain ASCII art and decorations
-    draw_lain_art(stdscr, height, width)
-
-    # Border decorations with Lain theme
-    try:
-        border_char = "─"
-        for i in range(1, width - 1):
-            stdscr.addstr(5, i, border_char, curses.color_pair(3))
-            stdscr.addstr(height - 5, i, border_char, curses.color_pair(3))
-
-        # Corner accents
-        stdscr.addstr(5, 0, "┌", curses.color_pair(3))
-        stdscr.addstr(5, width - 1, "┐", curses.color_pair(3))
-        stdscr.addstr(height - 5, 0, "└", curses.color_pair(3))
-        stdscr.addstr(height - 5, width - 1, "┘", curses.color_pair(3))
-    except:
-        pass
+    # Glitches come and go every frame
+    draw_glitch(stdscr, player, height, width)
 
     stdscr.refresh()
 
@@ -510,7 +663,6 @@ def draw_ui(stdscr, player):
 def show_intro(stdscr):
     """Display intro screen with Lain quote"""
     curses.curs_set(0)
-    height, width = stdscr.getmaxyx()
 
     # Initialize colors first
     curses.start_color()
@@ -525,10 +677,18 @@ def show_intro(stdscr):
     curses.init_pair(3, 11, -1)
     curses.init_pair(4, 12, -1)
 
+    rng = np.random.default_rng()
+
+    # getch waits up to 50ms, which paces the frames and returns early on a key
+    stdscr.timeout(50)
+
     # Intro sequence
     for frame in range(60):  # About 3 seconds
         stdscr.clear()
 
+        # Re-read the size every frame so a resize mid-intro is picked up
+        height, width = stdscr.getmaxyx()
+
         # Main quote
         quote1 = "CLOSE THE WORLD,"
         quote2 = "OPEN THE nExt"
@@ -536,54 +696,46 @@ def show_intro(stdscr):
         # Calculate center position
         center_row = height // 2
 
-        try:
-            # Fade in effect
-            if frame < 15:
-                if frame % 3 == 0:
-                    stdscr.addstr(center_row - 1, (width - len(quote1)) // 2,
-                                quote1, curses.color_pair(3) | curses.A_BOLD)
-            else:
-                stdscr.addstr(center_row - 1, (width - len(quote1)) // 2,
-                            quote1, curses.color_pair(3) | curses.A_BOLD)
-
-            if frame >= 10:
-                stdscr.addstr(center_row + 1, (width - len(quote2)) // 2,
-                            quote2, curses.color_pair(2) | curses.A_BOLD)
-
-            # Additional text after main quote appears
-            if frame >= 30:
-                subtitle = "[ SERIAL EXPERIMENTS LAIN ]"
-                stdscr.addstr(center_row + 4, (width - len(subtitle)) // 2,
-                            subtitle, curses.color_pair(1))
-
-            if frame >= 40:
-                prompt = "PRESS ANY KEY TO CONNECT TO THE WIRED"
-                stdscr.addstr(height - 3, (width - len(prompt)) // 2,
-                            prompt, curses.color_pair(2))
-
-            # Glitch effect
-            if frame > 20 and np.random.random() < 0.15:
-                import random
-                glitch_chars = ["█", "▓", "▒", "░", "▪", "▫", "#", "@"]
-                for _ in range(5):
-                    x = random.randint(2, width - 3)
-                    y = random.randint(2, height - 3)
-                    char = random.choice(glitch_chars)
-                    stdscr.addstr(y, x, char, curses.color_pair(4))
-
-        except:
-            pass
+        # Fade in effect
+        if frame < 15:
+            if frame % 3 == 0:
+                safe_addstr(stdscr, center_row - 1, (width - len(quote1)) // 2,
+                            quote1, curses.color_pair(3) | curses.A_BOLD, height, width)
+        else:
+            safe_addstr(stdscr, center_row - 1, (width - len(quote1)) // 2,
+                        quote1, curses.color_pair(3) | curses.A_BOLD, height, width)
+
+        if frame >= 10:
+            safe_addstr(stdscr, center_row + 1, (width - len(quote2)) // 2,
+                        quote2, curses.color_pair(2) | curses.A_BOLD, height, width)
+
+        # Additional text after main quote appears
+        if frame >= 30:
+            subtitle = "[ SERIAL EXPERIMENTS LAIN ]"
+            safe_addstr(stdscr, center_row + 4, (width - len(subtitle)) // 2,
+                        subtitle, curses.color_pair(1), height, width)
+
+        if frame >= 40:
+            prompt = "PRESS ANY KEY TO CONNECT TO THE WIRED"
+            safe_addstr(stdscr, height - 3, (width - len(prompt)) // 2,
+                        prompt, curses.color_pair(2), height, width)
+
+        # Glitch effect
+        if frame > 20 and rng.random() < 0.15 and height > 4 and width > 4:
+            xs = rng.integers(2, width - 2, size=5).tolist()
+            ys = rng.integers(2, height - 2, size=5).tolist()
+            chars = rng.choice(INTRO_GLITCH_CHARS, size=5)
+            for y, x, char in zip(ys, xs, chars):
+                safe_addstr(stdscr, y, x, char, curses.color_pair(4), height, width)
 
         stdscr.refresh()
-        time.sleep(0.05)
 
         # Check for key press to skip
-        stdscr.nodelay(1)
         if stdscr.getch() != -1 and frame > 20:
             break
 
     # Wait for key press if auto-sequence completed
-    stdscr.nodelay(0)
+    stdscr.timeout(-1)
     stdscr.getch()
     stdscr.clear()
 
@@ -595,8 +747,7 @@ def main(stdscr):
 
     # Setup curses
     curses.curs_set(0)  # Hide cursor
-    stdscr.nodelay(1)  # Non-blocking input
-    stdscr.timeout(50)  # 50ms timeout for input
+    stdscr.timeout(50)  # 50ms timeout for input - also paces the main loop
 
     # Initialize color pairs (Serial Experiments Lain theme - Dark Magenta)
     curses.start_color()
@@ -618,12 +769,23 @@ def main(stdscr):
     # Create player
     player = MP3Player()
 
+    # Look color attributes up once instead of on every frame
+    player.CP1, player.CP2, player.CP3, player.CP4, player.CP5 = [
+        curses.color_pair(i) for i in (1, 2, 3, 4, 5)]
+    player.CP3B = curses.color_pair(3) | curses.A_BOLD
+
     # Auto-play first song if available
     if player.songs:
         player.play_song()
 
+    # Static UI is drawn once here and again on every resize
+    draw_static(stdscr, player)
+
     # Main loop
     while player.running:
+        # Query the mixer once per frame; everything else reads the cache
+        player.poll_mixer()
+
         # Draw UI
         draw_ui(stdscr, player)
 
@@ -652,18 +814,15 @@ def main(stdscr):
             elif key == curses.KEY_RESIZE:
                 # Handle terminal resize
                 stdscr.clear()
-                stdscr.refresh()
+                draw_static(stdscr, player)
         except:
             pass
 
         # Check if song ended
-        if not mixer.music.get_busy() and not player.paused and player.songs:
-            player.next_song()
-
-        time.sleep(0.05)  # Increased sleep time to reduce flickering
+        player.advance_if_finished()
 
     # Cleanup
-    mixer.music.stop()
+    player.stop()
     pygame.quit()
 
 
@@ -35,6 +35,6 @@ if [ $? -eq 0 ]; then
 else
     echo ""
     echo "❌ Failed to install dependencies"
-    echo "Try running manually: pip3 install pygame numpy"
+    echo "Try running manually: pip3 install pygame numpy mutagen"
     exit 1
 fi